@@ -54,7 +54,7 @@ def oauth_list(ctx: click.Context) -> None:
             console.print("  dango oauth facebook_ads")
             return
 
-        from dango.oauth.validation import validate_token
+        from dango.oauth.validation import validate_tokens
 
         # Create table
         table = Table(title=f"OAuth Credentials ({len(credentials)})", show_header=True)
@@ -65,9 +65,9 @@ def oauth_list(ctx: click.Context) -> None:
         table.add_column("Created", style="dim")
 
         with console.status("Validating tokens..."):
-            for cred in credentials:
-                # Live-validate token status
-                result = validate_token(cred)
+            # Live-validate token status
+            results = validate_tokens(credentials)
+            for cred, result in zip(credentials, results, strict=True):
                 if result.error_code == "network_error":
                     # Fallback to metadata when we can't reach the API
                     if cred.is_expired():
@@ -131,15 +131,15 @@ def oauth_status(ctx: click.Context) -> None:
             return
 
         from dango.oauth.storage import OAuthCredential
-        from dango.oauth.validation import TokenValidationResult, validate_token
+        from dango.oauth.validation import TokenValidationResult, validate_tokens
 
         # Validate all tokens and categorize
         invalid: list[tuple[OAuthCredential, TokenValidationResult]] = []
         expiring_soon: list[tuple[OAuthCredential, TokenValidationResult]] = []
 
         with console.status("Validating tokens..."):
-            for cred in credentials:
-                result = validate_token(cred)
+            results = validate_tokens(credentials)
+            for cred, result in zip(credentials, results, strict=True):
                 if not result.valid and result.error_code != "network_error":
                     invalid.append((cred, result))
                 elif (
@@ -289,7 +289,7 @@ def oauth_refresh(ctx: click.Context, source_type: str) -> None:
         if cred.provider == "google":
             service = cred.metadata.get("service", "google_ads") if cred.metadata else "google_ads"
             google_provider = GoogleOAuthProvider(oauth_manager)
-            new_oauth_name = google_provider.authenticate(service=service)
+            new_oauth_name = google_provider.authenticate(service=service, reuse_existing=False)
 
         elif cred.provider == "facebook_ads":
             facebook_provider = FacebookOAuthProvider(oauth_manager)
@@ -507,6 +507,7 @@ def oauth_check(ctx: click.Context) -> None:
       dango oauth check
     """
     import os
+    from datetime import datetime
 
     from dotenv import load_dotenv
 
@@ -572,12 +573,13 @@ def oauth_check(ctx: click.Context) -> None:
             console.print("  [yellow]No OAuth tokens saved yet[/yellow]")
             console.print("  [dim]→ Run: dango oauth <provider> to authenticate[/dim]")
         else:
+            now = datetime.now()
             for cred in credentials:
-                if cred.is_expired():
+                if cred.is_expired(now):
                     status = "[red]EXPIRED[/red]"
                     action = f"[dim]→ Run: dango oauth refresh {cred.source_type}[/dim]"
-                elif cred.is_expiring_soon():
-                    days_left = cred.days_until_expiry()
+                elif cred.is_expiring_soon(now=now):
+                    days_left = cred.days_until_expiry(now)
                     status = f"[yellow]Expires in {days_left}d[/yellow]"
                     action = (
                         f"[dim]→ Consider refreshing: dango oauth refresh {cred.source_type}[/dim]"
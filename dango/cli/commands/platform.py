@@ -1032,6 +1032,8 @@ def status(ctx: click.Context) -> None:
 
         # OAuth token health (stored metadata only — no API calls for fast output)
         try:
+            from datetime import datetime
+
             from dango.oauth.storage import OAuthStorage
 
             oauth_storage = OAuthStorage(project_root)
@@ -1046,12 +1048,13 @@ def status(ctx: click.Context) -> None:
                 oauth_table.add_column("Account", style="dim")
 
                 has_warning = False
+                now = datetime.now()
                 for cred in oauth_creds:
-                    if cred.is_expired():
+                    if cred.is_expired(now):
                         token_status = "[red]Expired[/red]"
                         has_warning = True
-                    elif cred.is_expiring_soon():
-                        days_left = cred.days_until_expiry()
+                    elif cred.is_expiring_soon(now=now):
+                        days_left = cred.days_until_expiry(now)
                         token_status = f"[yellow]Expires in {days_left}d[/yellow]"
                         has_warning = True
                     else:
@@ -29,8 +29,6 @@ from urllib.parse import parse_qs, urlparse
 
 from rich.console import Console
 
-from dango.config.credentials import CredentialManager
-
 console = Console()
 
 
@@ -146,6 +144,10 @@ class OAuthManager:
         Args:
             project_root: Path to dango project root
         """
+        # Deferred: dango.config pulls in the pydantic config models, which
+        # callers that only need dango.oauth.storage should not pay for
+        from dango.config.credentials import CredentialManager
+
         self.project_root = Path(project_root)
         self.cred_manager = CredentialManager(project_root)
 
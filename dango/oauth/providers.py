@@ -3,20 +3,95 @@
 Provider-specific OAuth flows for data sources.
 """
 
+import hmac
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
+from urllib3.util.retry import Retry
 
 from dango.oauth import OAuthManager
 from dango.oauth.storage import OAuthCredential, OAuthStorage
 
 console = Console()
 
+# Transient provider errors are retried with jittered exponential backoff so a
+# single 429/5xx does not throw away an interactive flow. raise_on_status=False
+# hands the final response back, letting raise_for_status() surface the error.
+# Read errors are raised as-is rather than retried: the request may already have
+# been processed, and re-sending a single-use authorization code only yields
+# invalid_grant in place of the real timeout.
+_RETRY = Retry(
+    total=4,
+    read=False,
+    backoff_factor=0.5,
+    backoff_jitter=0.25,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# (connect, read) timeout for every provider call, so a network hang fails fast
+# instead of waiting on the OS TCP timeout
+_REQUEST_TIMEOUT = (5, 20)
+
+# Shared HTTP session for all provider calls. Pooled connections let the
+# token exchange and user info requests reuse the same TLS connection.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=_RETRY))
+
+
+@dataclass(frozen=True, slots=True)
+class GoogleTokenResponse:
+    """Tokens returned by Google's authorization-code exchange"""
+
+    access_token: str
+    refresh_token: str
+    expires_in: int | None = None
+    token_type: str = "Bearer"
+
+
+def _https_endpoint(url: str) -> str:
+    """
+    Validate a static provider endpoint once, at class definition time.
+
+    Endpoints are constants, so a typo (wrong scheme, missing host) fails on
+    import instead of partway through an interactive OAuth flow.
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "https" or not parts.hostname:
+        raise ValueError(f"OAuth endpoint must be an absolute https:// URL: {url!r}")
+    return url
+
+
+def _encode_static_auth_params(
+    base_scopes: list[str], scopes: dict[str, list[str]]
+) -> dict[str, str]:
+    """
+    Pre-encode the constant part of the Google authorization query per service.
+
+    Only client_id, redirect_uri and state vary between flows, so the scope
+    list and the fixed offline/consent flags are URL-encoded once.
+    """
+    return {
+        service: urlencode(
+            {
+                "response_type": "code",
+                "scope": " ".join(base_scopes + service_scopes),
+                "access_type": "offline",  # Request refresh token
+                "prompt": "consent",  # Force consent screen to get refresh token
+            }
+        )
+        for service, service_scopes in scopes.items()
+    }
+
 
 def _clean_pasted_input(value: str) -> str:
     """
@@ -69,8 +144,9 @@ class GoogleOAuthProvider(BaseOAuthProvider):
     """
 
     # OAuth endpoints
-    AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
-    TOKEN_URL = "https://oauth2.googleapis.com/token"
+    AUTH_URL = _https_endpoint("https://accounts.google.com/o/oauth2/v2/auth")
+    TOKEN_URL = _https_endpoint("https://oauth2.googleapis.com/token")
+    USERINFO_URL = _https_endpoint("https://www.googleapis.com/oauth2/v1/userinfo")
 
     # Exact API names as shown in Google Cloud Console
     API_NAMES = {
@@ -95,15 +171,25 @@ class GoogleOAuthProvider(BaseOAuthProvider):
         ],
     }
 
+    # Static authorization query string per service (see _encode_static_auth_params)
+    _STATIC_AUTH_QS = _encode_static_auth_params(BASE_SCOPES, SCOPES)
+
     def authenticate(
-        self, service: str = "google_ads", source_name: str | None = None
+        self,
+        service: str = "google_ads",
+        source_name: str | None = None,
+        reuse_existing: bool = True,
     ) -> str | None:
         """
         Run Google OAuth flow
 
+        If a stored refresh token for the service still works, offers to keep
+        using it instead of running the browser flow again.
+
         Args:
             service: Service to authenticate (google_ads, google_analytics, google_sheets)
             source_name: Optional source name (not used for Google - uses email as identifier)
+            reuse_existing: Offer to keep a working stored token (False forces the full flow)
 
         Returns:
             OAuth credential name if successful, None otherwise
@@ -112,10 +198,14 @@ class GoogleOAuthProvider(BaseOAuthProvider):
 
         from dotenv import load_dotenv
 
+        # Display name, e.g. "google_sheets" -> "Google Sheets"
+        service_label = service.replace("_", " ").title()
+
         try:
-            console.print(
-                f"\n[bold cyan]Google {service.replace('_', ' ').title()} Authentication[/bold cyan]\n"
-            )
+            console.print(f"\n[bold cyan]{service_label} Authentication[/bold cyan]\n")
+
+            if reuse_existing and self._reuse_existing_credentials(service):
+                return service
 
             # Try to load credentials from .env first
             env_file = self.project_root / ".env"
@@ -216,21 +306,19 @@ class GoogleOAuthProvider(BaseOAuthProvider):
 
                 # Build authorization URL
                 # Combine base scopes (userinfo) with service-specific scopes
-                service_scopes = self.SCOPES.get(service, self.SCOPES["google_ads"])
-                all_scopes = self.BASE_SCOPES + service_scopes
+                scope_key = service if service in self.SCOPES else "google_ads"
+                all_scopes = self.BASE_SCOPES + self.SCOPES[scope_key]
                 state = self.oauth_manager.generate_state()
 
-                auth_params = {
+                dynamic_params = {
                     "client_id": client_id,
                     "redirect_uri": self.oauth_manager.callback_url,
-                    "response_type": "code",
-                    "scope": " ".join(all_scopes),
-                    "access_type": "offline",  # Request refresh token
-                    "prompt": "consent",  # Force consent screen to get refresh token
                     "state": state,
                 }
 
-                auth_url = f"{self.AUTH_URL}?{urlencode(auth_params)}"
+                auth_url = (
+                    f"{self.AUTH_URL}?{self._STATIC_AUTH_QS[scope_key]}&{urlencode(dynamic_params)}"
+                )
 
                 # Start OAuth flow
                 console.print("\n[bold]Step 2: Authorize Dango[/bold]")
@@ -272,8 +360,9 @@ class GoogleOAuthProvider(BaseOAuthProvider):
                 # Exit loop on successful OAuth callback (has code, not sentinel)
                 break
 
-            # Verify state parameter
-            if oauth_response.get("state") != state:
+            # Verify state parameter (constant-time to avoid a timing side-channel)
+            returned_state = str(oauth_response.get("state", "")).encode()
+            if not hmac.compare_digest(returned_state, state.encode()):
                 console.print("[red]✗ Invalid state parameter (possible CSRF attack)[/red]")
                 return None
 
@@ -303,7 +392,7 @@ class GoogleOAuthProvider(BaseOAuthProvider):
 
             # Fetch user info to get email (identifier)
             console.print("\n[cyan]Fetching user info...[/cyan]")
-            user_info = self._fetch_user_info(tokens["access_token"])
+            user_info = self._fetch_user_info(tokens.access_token)
 
             if not user_info or "email" not in user_info:
                 console.print("[red]✗ Could not get user email[/red]")
@@ -317,7 +406,7 @@ class GoogleOAuthProvider(BaseOAuthProvider):
             credentials = {
                 "client_id": client_id,
                 "client_secret": client_secret,
-                "refresh_token": tokens["refresh_token"],
+                "refresh_token": tokens.refresh_token,
                 "project_id": "dango-oauth",  # Required by dlt GcpOAuthCredentials
                 "impersonated_email": email,  # Used by Google Ads
             }
@@ -394,7 +483,7 @@ class GoogleOAuthProvider(BaseOAuthProvider):
                 return None
 
             # Success message
-            console.print("\n[green]✅ Google authentication complete![/green]")
+            console.print(f"\n[green]✅ {service_label} authentication complete![/green]")
             console.print(f"[dim]Credentials saved for {service}[/dim]")
 
             return service  # Return source_type, not oauth_name
@@ -409,9 +498,91 @@ class GoogleOAuthProvider(BaseOAuthProvider):
             traceback.print_exc()
             return None
 
+    def _reuse_existing_credentials(self, service: str) -> bool:
+        """
+        Offer to keep stored credentials whose refresh token still works
+
+        A refresh grant is a single HTTP round-trip, while the browser flow
+        needs the user. Credentials granted for fewer scopes than the service
+        now requires, or Google Ads credentials without a developer token and
+        customer ID, are not reused.
+
+        Args:
+            service: Service being authenticated
+
+        Returns:
+            True if the stored credentials were kept, False to run the full flow
+        """
+        existing_cred = self.oauth_storage.get(service)
+        if not existing_cred:
+            return False
+
+        stored = existing_cred.credentials
+        if not all(stored.get(k) for k in ("client_id", "client_secret", "refresh_token")):
+            return False
+
+        granted_scopes = (existing_cred.metadata or {}).get("scopes")
+        required_scopes = self.BASE_SCOPES + self.SCOPES.get(service, self.SCOPES["google_ads"])
+        if granted_scopes is not None and not set(required_scopes).issubset(granted_scopes):
+            return False
+
+        # Google Ads also needs dev_token and customer_id, stored next to the credentials
+        # object; run the full flow so Step 3 can collect whichever is missing
+        if service == "google_ads":
+            section = self.oauth_manager.get_credentials(service) or {}
+            if not (section.get("dev_token") and section.get("customer_id")):
+                return False
+
+        console.print("[cyan]Checking existing refresh token...[/cyan]")
+        if not self._refresh_access_token(stored):
+            console.print(
+                "[yellow]Stored refresh token is no longer valid - starting a new authorization.[/yellow]\n"
+            )
+            return False
+
+        console.print(
+            f"[green]✓ Existing credentials are valid[/green] "
+            f"[dim]({existing_cred.account_info or existing_cred.identifier})[/dim]"
+        )
+        if not Confirm.ask("\n[cyan]Keep using these credentials?[/cyan]", default=True):
+            console.print("[dim]Proceeding with full re-authentication...[/dim]\n")
+            return False
+
+        if self.oauth_storage.update_last_refreshed(service):
+            return True
+
+        # No tracking metadata yet (e.g. credentials written by hand) - save it in full
+        existing_cred.last_refreshed = datetime.now()
+        return self.oauth_storage.save(existing_cred)
+
+    def _refresh_access_token(self, credentials: dict[str, Any]) -> str | None:
+        """
+        Exchange a stored refresh token for a new access token
+
+        Args:
+            credentials: Stored credentials with client_id, client_secret, refresh_token
+
+        Returns:
+            Access token, or None if the refresh grant failed
+        """
+        token_data = {
+            "grant_type": "refresh_token",
+            "refresh_token": credentials["refresh_token"],
+            "client_id": credentials["client_id"],
+            "client_secret": credentials["client_secret"],
+        }
+
+        try:
+            response = _SESSION.post(self.TOKEN_URL, data=token_data, timeout=_REQUEST_TIMEOUT)
+            response.raise_for_status()
+            access_token: str | None = response.json().get("access_token")
+            return access_token or None
+        except (requests.exceptions.RequestException, ValueError):
+            return None
+
     def _exchange_code_for_tokens(
         self, code: str, client_id: str, client_secret: str
-    ) -> dict[str, str] | None:
+    ) -> GoogleTokenResponse | None:
         """
         Exchange authorization code for access and refresh tokens
 
@@ -421,7 +592,7 @@ class GoogleOAuthProvider(BaseOAuthProvider):
             client_secret: OAuth client secret
 
         Returns:
-            Dictionary with access_token and refresh_token, or None if failed
+            GoogleTokenResponse with access and refresh tokens, or None if failed
         """
         try:
             token_data = {
@@ -432,7 +603,7 @@ class GoogleOAuthProvider(BaseOAuthProvider):
                 "grant_type": "authorization_code",
             }
 
-            response = requests.post(self.TOKEN_URL, data=token_data)
+            response = _SESSION.post(self.TOKEN_URL, data=token_data, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
 
             tokens = response.json()
@@ -447,8 +618,17 @@ class GoogleOAuthProvider(BaseOAuthProvider):
                 console.print("[yellow]   Then try again.[/yellow]")
                 return None
 
+            if "access_token" not in tokens:
+                console.print("[red]✗ No access_token in response[/red]")
+                return None
+
             console.print("[green]✓ Tokens received successfully![/green]")
-            return tokens
+            return GoogleTokenResponse(
+                access_token=tokens["access_token"],
+                refresh_token=tokens["refresh_token"],
+                expires_in=tokens.get("expires_in"),
+                token_type=tokens.get("token_type", "Bearer"),
+            )
 
         except requests.exceptions.RequestException as e:
             console.print(f"[red]✗ Token exchange failed: {e}[/red]")
@@ -467,10 +647,9 @@ class GoogleOAuthProvider(BaseOAuthProvider):
             Dictionary with user info (email, name, etc.) or None if failed
         """
         try:
-            user_info_url = "https://www.googleapis.com/oauth2/v1/userinfo"
             headers = {"Authorization": f"Bearer {access_token}"}
 
-            response = requests.get(user_info_url, headers=headers)
+            response = _SESSION.get(self.USERINFO_URL, headers=headers, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
 
             user_info = response.json()
@@ -492,7 +671,7 @@ class FacebookOAuthProvider(BaseOAuthProvider):
     """
 
     # Token exchange endpoint
-    TOKEN_EXCHANGE_URL = "https://graph.facebook.com/v18.0/oauth/access_token"
+    TOKEN_EXCHANGE_URL = _https_endpoint("https://graph.facebook.com/v18.0/oauth/access_token")
 
     def authenticate(self, source_name: str | None = None) -> str | None:
         """
@@ -728,7 +907,9 @@ class FacebookOAuthProvider(BaseOAuthProvider):
                 "fb_exchange_token": short_token,
             }
 
-            response = requests.get(self.TOKEN_EXCHANGE_URL, params=params)
+            response = _SESSION.get(
+                self.TOKEN_EXCHANGE_URL, params=params, timeout=_REQUEST_TIMEOUT
+            )
             response.raise_for_status()
 
             data = response.json()
@@ -3,12 +3,13 @@
 Routes OAuth authentication requests to the correct provider based on source type. Used by the source wizard for inline OAuth during source configuration.
 """
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 
 from dango.oauth import OAuthManager
-from dango.oauth.providers import FacebookOAuthProvider, GoogleOAuthProvider
 
 console = Console()
 
@@ -20,6 +21,44 @@ OAUTH_PROVIDER_MAP = {
     "facebook_ads": ("facebook", None),
 }
 
+# Google sources share one OAuth client, so any of them can satisfy the others
+_GOOGLE_SOURCES = ("google_ads", "google_analytics", "google_sheets")
+_GOOGLE_OAUTH_FIELDS = frozenset({"client_id", "client_secret", "refresh_token"})
+
+
+def _has_google_oauth(source_section: dict[str, Any]) -> bool:
+    """Check for a complete nested credentials object (dlt GcpOAuthCredentials)."""
+    return _GOOGLE_OAUTH_FIELDS.issubset(source_section.get("credentials") or {})
+
+
+# Provider runners import their provider class on first use: providers pull in
+# requests and the interactive prompts, which plain dango.oauth imports don't need.
+def _run_google_oauth(oauth_manager: OAuthManager, service: str | None, source_name: str) -> bool:
+    """Run the Google flow for one service."""
+    from dango.oauth.providers import GoogleOAuthProvider
+
+    if service is None:
+        console.print("[red]Missing service for Google OAuth provider[/red]")
+        return False
+    # Pass source_name for instance-specific credentials
+    provider = GoogleOAuthProvider(oauth_manager)
+    return provider.authenticate(service=service, source_name=source_name) is not None
+
+
+def _run_facebook_oauth(oauth_manager: OAuthManager, service: str | None, source_name: str) -> bool:
+    """Run the Facebook Ads flow."""
+    from dango.oauth.providers import FacebookOAuthProvider
+
+    # Pass source_name for instance-specific credentials
+    return FacebookOAuthProvider(oauth_manager).authenticate(source_name=source_name) is not None
+
+
+# Map provider names (from OAUTH_PROVIDER_MAP) to their flow runners
+_PROVIDER_RUNNERS: dict[str, Callable[[OAuthManager, str | None, str], bool]] = {
+    "google": _run_google_oauth,
+    "facebook": _run_facebook_oauth,
+}
+
 
 def run_oauth_for_source(source_type: str, source_name: str, project_root: Path) -> bool:
     """
@@ -43,36 +82,28 @@ def run_oauth_for_source(source_type: str, source_name: str, project_root: Path)
 
     provider_name, service = OAUTH_PROVIDER_MAP[source_type]
 
+    runner = _PROVIDER_RUNNERS.get(provider_name)
+    if runner is None:
+        console.print(f"[red]❌ Unknown OAuth provider: {provider_name}[/red]")
+        return False
+
     # Create OAuth manager
     oauth_manager = OAuthManager(project_root)
 
     # Route to correct provider
     try:
-        if provider_name == "google":
-            if service is None:
-                console.print("[red]Missing service for Google OAuth provider[/red]")
-                return False
-            google_provider = GoogleOAuthProvider(oauth_manager)
-            # Pass source_name for instance-specific credentials
-            return (
-                google_provider.authenticate(service=service, source_name=source_name) is not None
-            )
-
-        elif provider_name == "facebook":
-            fb_provider = FacebookOAuthProvider(oauth_manager)
-            # Pass source_name for instance-specific credentials
-            return fb_provider.authenticate(source_name=source_name) is not None
-
-        else:
-            console.print(f"[red]❌ Unknown OAuth provider: {provider_name}[/red]")
-            return False
-
+        return runner(oauth_manager, service, source_name)
     except Exception as e:
         console.print(f"[red]❌ OAuth authentication failed: {e}[/red]")
         return False
 
 
-def check_oauth_credentials_exist(source_type: str, source_name: str, project_root: Path) -> bool:
+def check_oauth_credentials_exist(
+    source_type: str,
+    source_name: str,
+    project_root: Path,
+    secrets: dict[str, Any] | None = None,
+) -> bool:
     """
     Check if OAuth credentials already exist for a source instance.
 
@@ -83,17 +114,18 @@ def check_oauth_credentials_exist(source_type: str, source_name: str, project_ro
         source_type: Source type key (e.g., "google_ads")
         source_name: Source instance name (e.g., "google_ads_us")
         project_root: Path to project root
+        secrets: Already-parsed .dlt/secrets.toml, to avoid reloading it when
+            checking many sources (loaded from project_root if None)
 
     Returns:
         True if credentials exist, False otherwise
     """
-    from dango.config.credentials import CredentialManager
-
-    cred_manager = CredentialManager(project_root)
-
     try:
-        # Load .dlt/secrets.toml
-        secrets = cred_manager.load_secrets()
+        if secrets is None:
+            from dango.config.credentials import CredentialManager
+
+            # Load .dlt/secrets.toml
+            secrets = CredentialManager(project_root).load_secrets()
 
         # Check if source has credentials
         if "sources" not in secrets:
@@ -104,8 +136,8 @@ def check_oauth_credentials_exist(source_type: str, source_name: str, project_ro
             source_creds = secrets["sources"][source_name]
 
             # Check for required OAuth fields based on source type
-            if source_type in ["google_ads", "google_analytics", "google_sheets"]:
-                if all(k in source_creds for k in ["client_id", "client_secret", "refresh_token"]):
+            if source_type in _GOOGLE_SOURCES:
+                if _has_google_oauth(source_creds):
                     return True
             elif source_type == "facebook_ads":
                 if "access_token" in source_creds:
@@ -113,17 +145,13 @@ def check_oauth_credentials_exist(source_type: str, source_name: str, project_ro
 
         # Check shared provider credentials (fallback)
         # For Google services, check for shared Google OAuth credentials
-        if source_type in ["google_ads", "google_analytics", "google_sheets"]:
-            # Check if any Google OAuth creds exist
-            for google_source in ["google_ads", "google_analytics", "google_sheets"]:
-                if google_source in secrets["sources"]:
-                    source_creds = secrets["sources"][google_source]
-                    # Check for OAuth fields (client_id, client_secret, refresh_token)
-                    if all(
-                        k in source_creds for k in ["client_id", "client_secret", "refresh_token"]
-                    ):
-                        return True
-            return False
+        if source_type in _GOOGLE_SOURCES:
+            # Check if any Google source has the OAuth fields
+            sources = secrets["sources"]
+            return any(
+                _has_google_oauth(sources.get(google_source, {}))
+                for google_source in _GOOGLE_SOURCES
+            )
 
         # For Facebook Ads - check shared credentials
         elif source_type == "facebook_ads":
@@ -139,13 +167,16 @@ def check_oauth_credentials_exist(source_type: str, source_name: str, project_ro
         return False
 
 
-def get_oauth_status_message(source_type: str, project_root: Path) -> str | None:
+def get_oauth_status_message(
+    source_type: str, project_root: Path, secrets: dict[str, Any] | None = None
+) -> str | None:
     """
     Get a status message about OAuth credentials for a source.
 
     Args:
         source_type: Source type key
         project_root: Path to project root
+        secrets: Already-parsed .dlt/secrets.toml (loaded from project_root if None)
 
     Returns:
         Status message or None if not applicable
@@ -153,7 +184,7 @@ def get_oauth_status_message(source_type: str, project_root: Path) -> str | None
     if source_type not in OAUTH_PROVIDER_MAP:
         return None
 
-    if check_oauth_credentials_exist(source_type, source_type, project_root):
+    if check_oauth_credentials_exist(source_type, source_type, project_root, secrets=secrets):
         return "[green]✓ OAuth credentials already configured[/green]"
     else:
         return "[yellow]⚠️  OAuth credentials not found - setup required[/yellow]"
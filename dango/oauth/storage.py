@@ -3,18 +3,67 @@
 OAuth Credential Storage.
 """
 
+import copy
+import os
+import sys
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import toml
+import tomli_w
 from rich.console import Console
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
 console = Console()
 
+# Only Google sources use a nested credentials object (GcpOAuthCredentials pattern)
+_CREDENTIALS_OBJECT_SOURCES = frozenset({"google_ads", "google_analytics", "google_sheets"})
+# Keys that mark a flat (non-Google) sources.{source_type} section as holding credentials
+_FLAT_CREDENTIAL_MARKERS = frozenset({"access_token", "api_key", "private_app_password"})
+
+
+def _drop_none(value: Any) -> Any:
+    """Recursively drop None values, which TOML cannot represent"""
+    if isinstance(value, dict):
+        return {k: _drop_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_none(v) for v in value if v is not None]
+    return value
+
+
+def _source_credentials(source_type: str, source_section: dict[str, Any]) -> dict[str, Any] | None:
+    """Credentials held in a sources.{source_type} section, or None if it has none"""
+    if not source_section:
+        return None
+    if source_type in _CREDENTIALS_OBJECT_SOURCES:
+        return source_section.get("credentials") or None
+    if _FLAT_CREDENTIAL_MARKERS.intersection(source_section):
+        return source_section
+    return None
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    """
+    Parse a stored timestamp, or None if absent
+
+    Values are written by OAuthCredential.to_dict() with isoformat(), which
+    datetime.fromisoformat() (implemented in C) reads directly. Native TOML
+    datetimes are passed through unchanged.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
 
-@dataclass
+@dataclass(slots=True)
 class OAuthCredential:
     """
     OAuth credential with metadata
@@ -41,22 +90,70 @@ class OAuthCredential:
     last_refreshed: datetime | None = None
     metadata: dict[str, Any] | None = None
 
-    def is_expired(self) -> bool:
-        """Check if credential has expired"""
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize tracking metadata for the dango.oauth.{source_type} section
+
+        Credentials are excluded (save() writes them to sources.{source_type}),
+        and unset optional fields are omitted since TOML has no null.
+        """
+        data: dict[str, Any] = {
+            "provider": self.provider,
+            "identifier": self.identifier,
+            "account_info": self.account_info,
+            "created_at": self.created_at.isoformat(),
+        }
+        if self.expires_at:
+            data["expires_at"] = self.expires_at.isoformat()
+        if self.last_refreshed:
+            data["last_refreshed"] = self.last_refreshed.isoformat()
+        if self.metadata is not None:
+            data["metadata"] = self.metadata
+        return data
+
+    @classmethod
+    def from_dict(
+        cls, source_type: str, data: dict[str, Any], credentials: dict[str, Any]
+    ) -> "OAuthCredential":
+        """
+        Build a credential from its dango.oauth.{source_type} metadata section
+
+        Args:
+            source_type: dlt source type the metadata belongs to
+            data: Metadata as written by to_dict() (may be empty)
+            credentials: Credentials read from sources.{source_type}
+
+        Returns:
+            OAuthCredential instance
+        """
+        return cls(
+            source_type=source_type,
+            provider=data.get("provider", "unknown"),
+            identifier=data.get("identifier", ""),
+            account_info=data.get("account_info", ""),
+            credentials=credentials,
+            created_at=_parse_datetime(data.get("created_at")) or datetime.now(),
+            expires_at=_parse_datetime(data.get("expires_at")),
+            last_refreshed=_parse_datetime(data.get("last_refreshed")),
+            metadata=data.get("metadata"),
+        )
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """Check if credential has expired as of now (default: current time)"""
         if not self.expires_at:
             return False
-        return datetime.now() >= self.expires_at
+        return (now or datetime.now()) >= self.expires_at
 
-    def days_until_expiry(self) -> int | None:
+    def days_until_expiry(self, now: datetime | None = None) -> int | None:
         """Get days until expiry, or None if no expiry"""
         if not self.expires_at:
             return None
-        delta = self.expires_at - datetime.now()
+        delta = self.expires_at - (now or datetime.now())
         return max(0, delta.days)
 
-    def is_expiring_soon(self, days: int = 7) -> bool:
+    def is_expiring_soon(self, days: int = 7, now: datetime | None = None) -> bool:
         """Check if credential expires within N days"""
-        days_left = self.days_until_expiry()
+        days_left = self.days_until_expiry(now)
         return days_left is not None and days_left <= days
 
 
@@ -86,17 +183,74 @@ class OAuthStorage:
         if not self.secrets_file.exists():
             self.secrets_file.write_text("")
 
+        # Parsed secrets.toml, reused while the file's (mtime_ns, size) is unchanged
+        self._cache: dict[str, Any] | None = None
+        self._cache_stat: tuple[int, int] | None = None
+        # source_type -> dango.oauth metadata, rebuilt with the cache
+        self._by_name: dict[str, dict[str, Any]] = {}
+
+    def _set_cache(self, secrets: dict[str, Any], file_stat: tuple[int, int] | None) -> None:
+        """Replace the parse cache and rebuild the metadata index from it"""
+        self._cache = secrets
+        self._cache_stat = file_stat
+
+        oauth_meta = secrets.get("dango", {}).get("oauth", {})
+        self._by_name = {k: v for k, v in oauth_meta.items() if isinstance(v, dict)}
+
+    def _cached_secrets(self) -> dict[str, Any]:
+        """Parsed secrets.toml, re-read only if it changed (shared: do not mutate)"""
+        try:
+            stat = self.secrets_file.stat()
+        except FileNotFoundError:
+            self._set_cache({}, None)
+            return {}
+
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is None or self._cache_stat != file_stat:
+            # Read the whole file in one call and parse from memory
+            secrets = (
+                tomllib.loads(self.secrets_file.read_text(encoding="utf-8")) if stat.st_size else {}
+            )
+            self._set_cache(secrets, file_stat)
+            return secrets
+        return self._cache
+
     def _load_secrets(self) -> dict[str, Any]:
-        """Load secrets.toml"""
-        if self.secrets_file.exists() and self.secrets_file.stat().st_size > 0:
-            result: dict[str, Any] = toml.load(self.secrets_file)
-            return result
-        return {}
+        """Load secrets.toml as a deep copy of the parse cache, safe to mutate"""
+        return copy.deepcopy(self._cached_secrets())
 
     def _save_secrets(self, secrets: dict[str, Any]) -> None:
-        """Save secrets.toml"""
-        with open(self.secrets_file, "w") as f:
-            toml.dump(secrets, f)
+        """
+        Save secrets.toml atomically (temp file + rename) and refresh the parse cache
+
+        Skipped when the content matches the cached parse of the file on disk.
+        """
+        # _drop_none builds fresh containers, so the cache shares nothing with callers
+        cleaned: dict[str, Any] = _drop_none(secrets)
+
+        try:
+            stat = self.secrets_file.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            if self._cache_stat == (stat.st_mtime_ns, stat.st_size) and cleaned == self._cache:
+                return
+
+        fd, tmp = tempfile.mkstemp(dir=self.dlt_dir, prefix=".secrets_", suffix=".toml.tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                tomli_w.dump(cleaned, fh)
+            os.replace(tmp, self.secrets_file)
+        except BaseException:
+            # Clean up temp file on failure
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+        stat = self.secrets_file.stat()
+        self._set_cache(cleaned, (stat.st_mtime_ns, stat.st_size))
 
     def save(self, oauth_cred: OAuthCredential) -> bool:
         """
@@ -113,17 +267,17 @@ class OAuthStorage:
             True if successful, False otherwise
         """
         try:
-            secrets = self._load_secrets()
-
-            # Ensure paths exist
-            if "sources" not in secrets:
-                secrets["sources"] = {}
-            if oauth_cred.source_type not in secrets["sources"]:
-                secrets["sources"][oauth_cred.source_type] = {}
-            if "dango" not in secrets:
-                secrets["dango"] = {}
-            if "oauth" not in secrets["dango"]:
-                secrets["dango"]["oauth"] = {}
+            cached = self._cached_secrets()
+
+            # Copy only the containers written below (assignments only, no in-place
+            # mutation); _save_secrets rebuilds everything before caching.
+            secrets = dict(cached)
+            secrets["sources"] = dict(cached.get("sources", {}))
+            secrets["sources"][oauth_cred.source_type] = dict(
+                secrets["sources"].get(oauth_cred.source_type, {})
+            )
+            secrets["dango"] = dict(cached.get("dango", {}))
+            secrets["dango"]["oauth"] = dict(secrets["dango"].get("oauth", {}))
 
             # Write credentials in dlt's expected format
             #
@@ -135,10 +289,7 @@ class OAuthStorage:
             source_section = secrets["sources"][oauth_cred.source_type]
             creds = oauth_cred.credentials
 
-            # Only Google sources use credentials object (GcpOAuthCredentials pattern)
-            CREDENTIALS_OBJECT_SOURCES = {"google_ads", "google_analytics", "google_sheets"}
-
-            if oauth_cred.source_type in CREDENTIALS_OBJECT_SOURCES:
+            if oauth_cred.source_type in _CREDENTIALS_OBJECT_SOURCES:
                 # Google: nested credentials object (dlt GcpOAuthCredentials)
                 source_section["credentials"] = {
                     "client_id": creds.get("client_id"),
@@ -162,17 +313,7 @@ class OAuthStorage:
                         source_section[key] = value
 
             # Write metadata for tracking (not used by dlt)
-            secrets["dango"]["oauth"][oauth_cred.source_type] = {
-                "provider": oauth_cred.provider,
-                "identifier": oauth_cred.identifier,
-                "account_info": oauth_cred.account_info,
-                "created_at": oauth_cred.created_at.isoformat(),
-                "expires_at": oauth_cred.expires_at.isoformat() if oauth_cred.expires_at else None,
-                "last_refreshed": oauth_cred.last_refreshed.isoformat()
-                if oauth_cred.last_refreshed
-                else None,
-                "metadata": oauth_cred.metadata,
-            }
+            secrets["dango"]["oauth"][oauth_cred.source_type] = oauth_cred.to_dict()
 
             self._save_secrets(secrets)
             console.print(f"[green]✓ Saved OAuth credentials for {oauth_cred.source_type}[/green]")
@@ -193,54 +334,18 @@ class OAuthStorage:
             OAuthCredential if found, None otherwise
         """
         try:
-            secrets = self._load_secrets()
+            secrets = self._cached_secrets()
 
-            # Get source section
             source_section = secrets.get("sources", {}).get(source_type, {})
-            if not source_section:
+            creds = _source_credentials(source_type, source_section)
+            if creds is None:
                 return None
 
-            # Google sources use nested credentials object (GcpOAuthCredentials)
-            # All other sources use flat parameters
-            CREDENTIALS_OBJECT_SOURCES = {"google_ads", "google_analytics", "google_sheets"}
-
-            if source_type in CREDENTIALS_OBJECT_SOURCES:
-                # Google: look for nested 'credentials' object
-                creds = source_section.get("credentials")
-                if not creds:
-                    return None
-            else:
-                # Non-Google: flat parameters are the credentials
-                # Check for common OAuth credential keys
-                if (
-                    "access_token" in source_section
-                    or "api_key" in source_section
-                    or "private_app_password" in source_section
-                ):
-                    creds = source_section
-                else:
-                    return None
-
             # Get metadata if available
-            meta = secrets.get("dango", {}).get("oauth", {}).get(source_type, {})
-
-            return OAuthCredential(
-                source_type=source_type,
-                provider=meta.get("provider", "unknown"),
-                identifier=meta.get("identifier", ""),
-                account_info=meta.get("account_info", ""),
-                credentials=creds,
-                created_at=datetime.fromisoformat(meta["created_at"])
-                if meta.get("created_at")
-                else datetime.now(),
-                expires_at=datetime.fromisoformat(meta["expires_at"])
-                if meta.get("expires_at")
-                else None,
-                last_refreshed=datetime.fromisoformat(meta["last_refreshed"])
-                if meta.get("last_refreshed")
-                else None,
-                metadata=meta.get("metadata"),
-            )
+            meta = self._by_name.get(source_type, {})
+
+            # Copy only this credential's sections out of the shared cache
+            return OAuthCredential.from_dict(source_type, copy.deepcopy(meta), copy.deepcopy(creds))
 
         except Exception as e:
             console.print(f"[red]✗ Failed to load OAuth credential for {source_type}: {e}[/red]")
@@ -257,62 +362,29 @@ class OAuthStorage:
             List of OAuth credentials
         """
         try:
-            secrets = self._load_secrets()
+            secrets = self._cached_secrets()
             credentials = []
 
             # Check each source type for credentials
-            oauth_meta = secrets.get("dango", {}).get("oauth", {})
-
-            # Google sources use nested credentials object (GcpOAuthCredentials)
-            CREDENTIALS_OBJECT_SOURCES = {"google_ads", "google_analytics", "google_sheets"}
-
-            for source_type, meta in oauth_meta.items():
+            for source_type, meta in self._by_name.items():
                 # Filter by provider if specified
                 if provider and meta.get("provider") != provider:
                     continue
 
-                # Get source section
                 source_section = secrets.get("sources", {}).get(source_type, {})
-                if not source_section:
+                creds = _source_credentials(source_type, source_section)
+                if creds is None:
                     continue
 
-                # Check credentials based on source type
-                if source_type in CREDENTIALS_OBJECT_SOURCES:
-                    # Google: look for nested 'credentials' object
-                    creds = source_section.get("credentials")
-                    if not creds:
-                        continue
-                else:
-                    # Non-Google: flat parameters are the credentials
-                    if (
-                        "access_token" in source_section
-                        or "api_key" in source_section
-                        or "private_app_password" in source_section
-                    ):
-                        creds = source_section
-                    else:
-                        continue
-
                 try:
-                    cred = OAuthCredential(
-                        source_type=source_type,
-                        provider=meta.get("provider", "unknown"),
-                        identifier=meta.get("identifier", ""),
-                        account_info=meta.get("account_info", ""),
-                        credentials=creds,
-                        created_at=datetime.fromisoformat(meta["created_at"])
-                        if meta.get("created_at")
-                        else datetime.now(),
-                        expires_at=datetime.fromisoformat(meta["expires_at"])
-                        if meta.get("expires_at")
-                        else None,
-                        last_refreshed=datetime.fromisoformat(meta["last_refreshed"])
-                        if meta.get("last_refreshed")
-                        else None,
-                        metadata=meta.get("metadata"),
+                    # Copy only what each credential holds out of the shared cache
+                    credentials.append(
+                        OAuthCredential.from_dict(
+                            source_type, copy.deepcopy(meta), copy.deepcopy(creds)
+                        )
                     )
-                    credentials.append(cred)
-                except Exception as e:
+                except (TypeError, ValueError) as e:
+                    # Malformed timestamps in hand-edited metadata; skip just this entry
                     console.print(f"[yellow]Warning: Could not load {source_type}: {e}[/yellow]")
                     continue
 
@@ -335,12 +407,9 @@ class OAuthStorage:
         try:
             secrets = self._load_secrets()
 
-            # Google sources use nested credentials object
-            CREDENTIALS_OBJECT_SOURCES = {"google_ads", "google_analytics", "google_sheets"}
-
             # Remove credentials
             if "sources" in secrets and source_type in secrets["sources"]:
-                if source_type in CREDENTIALS_OBJECT_SOURCES:
+                if source_type in _CREDENTIALS_OBJECT_SOURCES:
                     # Google: remove nested credentials object
                     if "credentials" in secrets["sources"][source_type]:
                         del secrets["sources"][source_type]["credentials"]
@@ -375,6 +444,40 @@ class OAuthStorage:
             console.print(f"[red]✗ Failed to delete OAuth credential: {e}[/red]")
             return False
 
+    def update_last_refreshed(self, source_type: str) -> bool:
+        """
+        Stamp last_refreshed on a credential's tracking metadata
+
+        Only dango.oauth.{source_type}.last_refreshed changes, so this skips
+        the full credential round-trip that get() + save() would do.
+
+        Args:
+            source_type: dlt source type whose token was refreshed
+
+        Returns:
+            True if updated, False if no metadata exists for the source type
+        """
+        try:
+            cached = self._cached_secrets()
+            meta = self._by_name.get(source_type)
+            if meta is None:
+                return False
+
+            # Copy just the containers on the path to this entry
+            secrets = dict(cached)
+            secrets["dango"] = dict(cached["dango"])
+            secrets["dango"]["oauth"] = dict(cached["dango"]["oauth"])
+            secrets["dango"]["oauth"][source_type] = {
+                **meta,
+                "last_refreshed": datetime.now().isoformat(),
+            }
+            self._save_secrets(secrets)
+            return True
+
+        except Exception as e:
+            console.print(f"[red]✗ Failed to update OAuth credential: {e}[/red]")
+            return False
+
     def exists(self, source_type: str) -> bool:
         """
         Check if OAuth credentials exist for a source type
@@ -385,19 +488,10 @@ class OAuthStorage:
         Returns:
             True if credentials exist
         """
-        secrets = self._load_secrets()
-        source_section = secrets.get("sources", {}).get(source_type, {})
-
-        # Google sources use nested credentials object
-        CREDENTIALS_OBJECT_SOURCES = {"google_ads", "google_analytics", "google_sheets"}
-
-        if source_type in CREDENTIALS_OBJECT_SOURCES:
-            creds = source_section.get("credentials")
-            return creds is not None and "client_id" in creds
-        else:
-            # Non-Google: check for common OAuth credential keys
-            return (
-                "access_token" in source_section
-                or "api_key" in source_section
-                or "private_app_password" in source_section
-            )
+        # Read-only check, so the shared cache is used without copying
+        source_section = self._cached_secrets().get("sources", {}).get(source_type, {})
+        creds = _source_credentials(source_type, source_section)
+        if creds is None:
+            return False
+        # A Google credentials object is only usable with its client_id
+        return source_type not in _CREDENTIALS_OBJECT_SOURCES or "client_id" in creds
@@ -16,6 +16,7 @@ provider API is momentarily unreachable.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -40,6 +41,9 @@ _GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v1/userinfo"
 # Facebook Graph API
 _FACEBOOK_ME_URL = "https://graph.facebook.com/me"
 
+# Upper bound on concurrent live token checks in validate_tokens()
+_MAX_VALIDATION_WORKERS = 8
+
 # Shopify API version (matches providers.py)
 _SHOPIFY_API_VERSION = "2024-01"
 
@@ -321,8 +325,10 @@ def validate_shopify_token(credential: OAuthCredential) -> TokenValidationResult
 
     try:
         url = f"https://{shop_url}/admin/api/{_SHOPIFY_API_VERSION}/shop.json"
+        # Only the shop name is used; fields=name keeps the response tiny
         response = requests.get(
             url,
+            params={"fields": "name"},
             headers={"X-Shopify-Access-Token": access_token},
             timeout=_REQUEST_TIMEOUT,
         )
@@ -402,6 +408,25 @@ def validate_token(credential: OAuthCredential) -> TokenValidationResult:
     return validator(credential)
 
 
+def validate_tokens(credentials: list[OAuthCredential]) -> list[TokenValidationResult]:
+    """Validate several OAuth credentials with concurrent live API calls.
+
+    Each check is an independent HTTP round-trip, so they run on a small
+    thread pool. One or two credentials are validated inline.
+
+    Args:
+        credentials: Credentials to validate.
+
+    Returns:
+        TokenValidationResult for each credential, in the same order.
+    """
+    if len(credentials) <= 2:
+        return [validate_token(cred) for cred in credentials]
+    workers = min(_MAX_VALIDATION_WORKERS, len(credentials))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate_token, credentials))
+
+
 def validate_all_tokens(project_root: Path) -> list[TokenValidationResult]:
     """Validate all stored OAuth tokens with live API calls.
 
@@ -412,12 +437,7 @@ def validate_all_tokens(project_root: Path) -> list[TokenValidationResult]:
         List of TokenValidationResult for each stored credential.
     """
     storage = OAuthStorage(project_root)
-    credentials = storage.list()
-    results: list[TokenValidationResult] = []
-    for cred in credentials:
-        result = validate_token(cred)
-        results.append(result)
-    return results
+    return validate_tokens(storage.list())
 
 
 def validate_before_sync(source_type: str, project_root: Path) -> None:
@@ -41,6 +41,9 @@ class SecureTokenStorage:
         self.dlt_dir = self.project_root / ".dlt"
         self.dlt_dir.mkdir(parents=True, exist_ok=True)
 
+        # Fernet instance built from the master key on first use (see _get_cipher)
+        self._cipher: Fernet | None = None
+
     def _get_encryption_key(self) -> bytes:
         """
         Get or create master encryption key from OS keychain
@@ -87,6 +90,20 @@ class SecureTokenStorage:
                     os.close(fd)
                 return key
 
+    def _get_cipher(self) -> Fernet:
+        """
+        Get the Fernet cipher, fetching the master key only once per instance
+
+        Looking the key up goes to the OS keychain, which is far slower than
+        the encryption itself, so it is not repeated for every token.
+
+        Returns:
+            Fernet instance for the master key
+        """
+        if self._cipher is None:
+            self._cipher = Fernet(self._get_encryption_key())
+        return self._cipher
+
     def encrypt_token(self, token_data: dict[str, Any]) -> str:
         """
         Encrypt token data
@@ -98,8 +115,7 @@ class SecureTokenStorage:
             Encrypted token as base64 string
         """
         try:
-            key = self._get_encryption_key()
-            f = Fernet(key)
+            f = self._get_cipher()
 
             # Serialize to JSON and encrypt
             json_data = json.dumps(token_data).encode("utf-8")
@@ -122,8 +138,7 @@ class SecureTokenStorage:
             Decrypted token data as dictionary
         """
         try:
-            key = self._get_encryption_key()
-            f = Fernet(key)
+            f = self._get_cipher()
 
             # Decrypt and deserialize
             decrypted = f.decrypt(encrypted_data.encode("utf-8"))
@@ -230,21 +230,22 @@ async def get_platform_health() -> dict[str, Any]:
     oauth_health: list[dict[str, Any]] = []
     try:
         oauth_storage = OAuthStorage(project_root)
+        now = datetime.now()
         for cred in oauth_storage.list():
             token_info: dict[str, Any] = {
                 "source_type": cred.source_type,
                 "provider": cred.provider,
-                "is_expired": cred.is_expired(),
-                "days_until_expiry": cred.days_until_expiry(),
+                "is_expired": cred.is_expired(now),
+                "days_until_expiry": cred.days_until_expiry(now),
             }
             oauth_health.append(token_info)
-            if cred.is_expired():
+            if token_info["is_expired"]:
                 critical_issues.append(
                     f"OAuth token expired for {cred.source_type}"
                     " \u2014 reconnect at /settings/secrets"
                 )
-            elif cred.is_expiring_soon(days=7):
-                days = cred.days_until_expiry()
+            elif cred.is_expiring_soon(days=7, now=now):
+                days = token_info["days_until_expiry"]
                 warnings.append(
                     f"OAuth token for {cred.source_type} expires in {days} day(s)"
                     " \u2014 reconnect at /settings/secrets"
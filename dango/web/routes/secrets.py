@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -198,6 +199,7 @@ async def list_oauth_credentials(
 
         storage = OAuthStorage(project_root)
         creds_list = list(storage.list())
+        now = datetime.now()
         for cred in creds_list:
             items.append(
                 {
@@ -207,8 +209,8 @@ async def list_oauth_credentials(
                     "account_info": cred.account_info,
                     "connected_at": cred.created_at.isoformat(),
                     "expires_at": cred.expires_at.isoformat() if cred.expires_at else None,
-                    "is_expired": cred.is_expired(),
-                    "days_until_expiry": cred.days_until_expiry(),
+                    "is_expired": cred.is_expired(now),
+                    "days_until_expiry": cred.days_until_expiry(now),
                     "valid": None,
                     "error": None,
                     "error_code": None,
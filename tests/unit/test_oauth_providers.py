@@ -0,0 +1,242 @@
+"""tests/unit/test_oauth_providers.py
+
+Tests for dango/oauth/providers.py — provider token exchange helpers.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs
+
+import pytest
+import requests
+
+from dango.config.credentials import CredentialManager
+from dango.oauth.providers import (
+    _REQUEST_TIMEOUT,
+    _SESSION,
+    FacebookOAuthProvider,
+    GoogleOAuthProvider,
+    _https_endpoint,
+)
+from tests.factories.oauth_factories import make_google_credential
+
+
+def _make_manager(tmp_path: Path) -> MagicMock:
+    """Create a stand-in OAuthManager rooted at tmp_path."""
+    manager = MagicMock()
+    manager.project_root = tmp_path
+    manager.callback_url = "http://localhost:8080/callback"
+    return manager
+
+
+def _json_response(payload: dict) -> MagicMock:
+    """Create a mock response that returns payload from .json()."""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+@pytest.mark.unit
+class TestSharedSession:
+    """Provider HTTP calls go through the pooled module-level session."""
+
+    @patch("dango.oauth.providers._SESSION")
+    def test_google_token_exchange_uses_session(
+        self, mock_session: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_session.post.return_value = _json_response(
+            {"access_token": "ya29.token", "refresh_token": "1//refresh"}
+        )
+        provider = GoogleOAuthProvider(_make_manager(tmp_path))
+
+        tokens = provider._exchange_code_for_tokens("code", "client-id", "client-secret")
+
+        assert tokens is not None
+        assert tokens.refresh_token == "1//refresh"
+        assert tokens.access_token == "ya29.token"
+        mock_session.post.assert_called_once()
+        assert mock_session.post.call_args.args[0] == GoogleOAuthProvider.TOKEN_URL
+
+    @patch("dango.oauth.providers._SESSION")
+    def test_google_token_exchange_without_refresh_token(
+        self, mock_session: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_session.post.return_value = _json_response({"access_token": "ya29.token"})
+        provider = GoogleOAuthProvider(_make_manager(tmp_path))
+
+        assert provider._exchange_code_for_tokens("code", "client-id", "client-secret") is None
+
+    @patch("dango.oauth.providers._SESSION")
+    def test_facebook_token_exchange_uses_session(
+        self, mock_session: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_session.get.return_value = _json_response({"access_token": "EAA-long"})
+        provider = FacebookOAuthProvider(_make_manager(tmp_path))
+
+        assert provider._exchange_token("EAA-short", "app-id", "app-secret") == "EAA-long"
+        assert mock_session.get.call_args.args[0] == FacebookOAuthProvider.TOKEN_EXCHANGE_URL
+
+    @patch("dango.oauth.providers._SESSION")
+    def test_token_exchange_timeout_fails_fast(
+        self, mock_session: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_session.post.side_effect = requests.Timeout("read timed out")
+        provider = GoogleOAuthProvider(_make_manager(tmp_path))
+
+        assert provider._exchange_code_for_tokens("code", "client-id", "client-secret") is None
+        assert mock_session.post.call_args.kwargs["timeout"] == _REQUEST_TIMEOUT
+
+    def test_session_retries_transient_errors(self) -> None:
+        retry = _SESSION.get_adapter("https://oauth2.googleapis.com").max_retries
+        assert retry.total == 4
+        assert {429, 503}.issubset(retry.status_forcelist)
+        assert "POST" in retry.allowed_methods
+        # A read timeout may mean the request was processed; never re-send it
+        assert retry.read is False
+        # Final retryable response is returned so raise_for_status() reports it
+        assert retry.raise_on_status is False
+
+
+@pytest.mark.unit
+class TestHttpsEndpoint:
+    """Tests for _https_endpoint() static endpoint validation."""
+
+    def test_accepts_https_url(self) -> None:
+        url = "https://oauth2.googleapis.com/token"
+        assert _https_endpoint(url) == url
+
+    @pytest.mark.parametrize("url", ["http://oauth2.googleapis.com/token", "https:///token", ""])
+    def test_rejects_non_https_or_hostless(self, url: str) -> None:
+        with pytest.raises(ValueError, match="https://"):
+            _https_endpoint(url)
+
+
+@pytest.mark.unit
+class TestGoogleStaticAuthQuery:
+    """Tests for the pre-encoded Google authorization query string."""
+
+    @pytest.mark.parametrize("service", sorted(GoogleOAuthProvider.SCOPES))
+    def test_static_params_per_service(self, service: str) -> None:
+        params = parse_qs(GoogleOAuthProvider._STATIC_AUTH_QS[service])
+
+        expected_scopes = GoogleOAuthProvider.BASE_SCOPES + GoogleOAuthProvider.SCOPES[service]
+        assert params["scope"] == [" ".join(expected_scopes)]
+        assert params["response_type"] == ["code"]
+        assert params["access_type"] == ["offline"]
+        assert params["prompt"] == ["consent"]
+        assert "client_id" not in params
+        assert "state" not in params
+
+
+@pytest.mark.unit
+class TestGoogleReuseExistingCredentials:
+    """Tests for reusing a stored Google refresh token instead of the browser flow."""
+
+    @patch("dango.oauth.providers.Confirm.ask", return_value=True)
+    @patch("dango.oauth.providers._SESSION")
+    def test_valid_refresh_token_skips_browser_flow(
+        self, mock_session: MagicMock, _mock_confirm: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_session.post.return_value = _json_response({"access_token": "ya29.fresh"})
+        manager = _make_manager(tmp_path)
+        provider = GoogleOAuthProvider(manager)
+        provider.oauth_storage.save(make_google_credential())
+
+        assert provider.authenticate(service="google_sheets") == "google_sheets"
+
+        manager.start_oauth_flow.assert_not_called()
+        assert mock_session.post.call_args.kwargs["data"]["grant_type"] == "refresh_token"
+        saved = provider.oauth_storage.get("google_sheets")
+        assert saved is not None
+        assert saved.last_refreshed is not None
+
+    @patch("dotenv.load_dotenv", side_effect=KeyboardInterrupt)
+    @patch("dango.oauth.providers.Confirm.ask", return_value=False)
+    @patch("dango.oauth.providers._SESSION")
+    def test_declining_prompt_runs_full_flow(
+        self,
+        mock_session: MagicMock,
+        mock_confirm: MagicMock,
+        mock_load_dotenv: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        mock_session.post.return_value = _json_response({"access_token": "ya29.fresh"})
+        provider = GoogleOAuthProvider(_make_manager(tmp_path))
+        provider.oauth_storage.save(make_google_credential())
+
+        # The browser flow starts by loading .env; interrupt it there
+        assert provider.authenticate(service="google_sheets") is None
+
+        mock_confirm.assert_called_once()
+        mock_load_dotenv.assert_called_once()
+        saved = provider.oauth_storage.get("google_sheets")
+        assert saved is not None
+        assert saved.last_refreshed is None
+
+    @patch("dotenv.load_dotenv", side_effect=KeyboardInterrupt)
+    @patch("dango.oauth.providers.Confirm.ask")
+    @patch("dango.oauth.providers._SESSION")
+    def test_reuse_disabled_skips_stored_token_check(
+        self,
+        mock_session: MagicMock,
+        mock_confirm: MagicMock,
+        mock_load_dotenv: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        provider = GoogleOAuthProvider(_make_manager(tmp_path))
+        provider.oauth_storage.save(make_google_credential())
+
+        assert provider.authenticate(service="google_sheets", reuse_existing=False) is None
+
+        mock_session.post.assert_not_called()
+        mock_confirm.assert_not_called()
+        mock_load_dotenv.assert_called_once()
+
+    @patch("dango.oauth.providers._SESSION")
+    def test_rejected_refresh_token_is_not_reused(
+        self, mock_session: MagicMock, tmp_path: Path
+    ) -> None:
+        response = MagicMock()
+        response.raise_for_status.side_effect = requests.HTTPError("400 invalid_grant")
+        mock_session.post.return_value = response
+        provider = GoogleOAuthProvider(_make_manager(tmp_path))
+        provider.oauth_storage.save(make_google_credential())
+
+        assert provider._reuse_existing_credentials("google_sheets") is False
+
+    @patch("dango.oauth.providers._SESSION")
+    def test_missing_scopes_are_not_reused(self, mock_session: MagicMock, tmp_path: Path) -> None:
+        provider = GoogleOAuthProvider(_make_manager(tmp_path))
+        provider.oauth_storage.save(
+            make_google_credential(metadata={"scopes": GoogleOAuthProvider.BASE_SCOPES})
+        )
+
+        assert provider._reuse_existing_credentials("google_sheets") is False
+        mock_session.post.assert_not_called()
+
+    @patch("dango.oauth.providers._SESSION")
+    def test_google_ads_without_ads_fields_is_not_reused(
+        self, mock_session: MagicMock, tmp_path: Path
+    ) -> None:
+        manager = _make_manager(tmp_path)
+        manager.get_credentials.side_effect = CredentialManager(tmp_path).get_source_credentials
+        provider = GoogleOAuthProvider(manager)
+        credential = make_google_credential(source_type="google_ads")
+        provider.oauth_storage.save(credential)
+
+        # Developer Token skipped earlier: re-running must reach Step 3 again
+        assert provider._reuse_existing_credentials("google_ads") is False
+        mock_session.post.assert_not_called()
+
+        credential.credentials.update(dev_token="dev-token", customer_id="1234567890")
+        provider.oauth_storage.save(credential)
+        mock_session.post.return_value = _json_response({"access_token": "ya29.fresh"})
+        with patch("dango.oauth.providers.Confirm.ask", return_value=True):
+            assert provider._reuse_existing_credentials("google_ads") is True
+
+    def test_no_stored_credentials(self, tmp_path: Path) -> None:
+        provider = GoogleOAuthProvider(_make_manager(tmp_path))
+        assert provider._reuse_existing_credentials("google_sheets") is False
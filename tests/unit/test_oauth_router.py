@@ -0,0 +1,102 @@
+"""tests/unit/test_oauth_router.py
+
+Tests for dango/oauth/router.py — credential existence checks and provider routing.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dango.oauth.router import (
+    check_oauth_credentials_exist,
+    get_oauth_status_message,
+    run_oauth_for_source,
+)
+from dango.oauth.storage import OAuthStorage
+from tests.factories.oauth_factories import make_google_credential
+
+
+def _write_secrets(project_root: Path, content: str) -> Path:
+    """Write .dlt/secrets.toml under project_root and return its path."""
+    secrets_file = project_root / ".dlt" / "secrets.toml"
+    secrets_file.parent.mkdir(parents=True, exist_ok=True)
+    secrets_file.write_text(content)
+    return secrets_file
+
+
+@pytest.mark.unit
+class TestCheckOAuthCredentialsExist:
+    """Tests for check_oauth_credentials_exist()."""
+
+    def test_missing_secrets_file(self, tmp_path: Path) -> None:
+        assert check_oauth_credentials_exist("google_sheets", "google_sheets", tmp_path) is False
+
+    def test_google_credentials_saved_by_storage(self, tmp_path: Path) -> None:
+        OAuthStorage(tmp_path).save(make_google_credential())
+        assert check_oauth_credentials_exist("google_sheets", "google_sheets", tmp_path) is True
+        # Google sources share one OAuth client
+        assert check_oauth_credentials_exist("google_ads", "google_ads", tmp_path) is True
+
+    def test_google_requires_nested_credentials(self, tmp_path: Path) -> None:
+        _write_secrets(
+            tmp_path,
+            '[sources.google_sheets]\nclient_id = "id"\nclient_secret = "s"\nrefresh_token = "r"\n',
+        )
+        assert check_oauth_credentials_exist("google_sheets", "google_sheets", tmp_path) is False
+
+    def test_facebook_requires_access_token(self, tmp_path: Path) -> None:
+        _write_secrets(tmp_path, '[sources.facebook_ads]\naccount_id = "1"\n')
+        assert check_oauth_credentials_exist("facebook_ads", "facebook_ads", tmp_path) is False
+
+    def test_preloaded_secrets_skip_disk(self, tmp_path: Path) -> None:
+        secrets = {"sources": {"facebook_ads": {"access_token": "EAA-token"}}}
+
+        with patch("dango.config.credentials.CredentialManager.load_secrets") as load:
+            assert check_oauth_credentials_exist(
+                "facebook_ads", "facebook_ads", tmp_path, secrets=secrets
+            )
+
+        load.assert_not_called()
+
+
+@pytest.mark.unit
+class TestGetOAuthStatusMessage:
+    """Tests for get_oauth_status_message()."""
+
+    def test_non_oauth_source(self, tmp_path: Path) -> None:
+        assert get_oauth_status_message("csv", tmp_path) is None
+
+    def test_uses_preloaded_secrets(self, tmp_path: Path) -> None:
+        secrets = {"sources": {"facebook_ads": {"access_token": "EAA-token"}}}
+        message = get_oauth_status_message("facebook_ads", tmp_path, secrets=secrets)
+        assert message is not None
+        assert "already configured" in message
+        assert "setup required" in str(get_oauth_status_message("facebook_ads", tmp_path))
+
+
+@pytest.mark.unit
+class TestRunOAuthForSource:
+    """Tests for run_oauth_for_source() provider dispatch."""
+
+    def test_unknown_source_type(self, tmp_path: Path) -> None:
+        assert run_oauth_for_source("hubspot", "hubspot", tmp_path) is False
+
+    @patch("dango.oauth.providers.GoogleOAuthProvider.authenticate", return_value="google_ads")
+    def test_routes_google_with_service(self, mock_auth: MagicMock, tmp_path: Path) -> None:
+        assert run_oauth_for_source("google_ads", "google_ads_us", tmp_path) is True
+        mock_auth.assert_called_once_with(service="google_ads", source_name="google_ads_us")
+
+    @patch("dango.oauth.providers.FacebookOAuthProvider.authenticate", return_value=None)
+    def test_routes_facebook(self, mock_auth: MagicMock, tmp_path: Path) -> None:
+        assert run_oauth_for_source("facebook_ads", "facebook_eu", tmp_path) is False
+        mock_auth.assert_called_once_with(source_name="facebook_eu")
+
+    @patch(
+        "dango.oauth.providers.GoogleOAuthProvider.authenticate",
+        side_effect=RuntimeError("boom"),
+    )
+    def test_provider_error_returns_false(self, _mock_auth: MagicMock, tmp_path: Path) -> None:
+        assert run_oauth_for_source("google_sheets", "google_sheets", tmp_path) is False
@@ -14,10 +14,11 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from dango.oauth.storage import OAuthStorage
+from dango.oauth.storage import OAuthCredential, OAuthStorage, tomllib
 from tests.factories.oauth_factories import (
     make_facebook_credential,
     make_google_credential,
@@ -76,6 +77,66 @@ class TestOAuthCredentialExpiry:
         assert cred.is_expiring_soon(days=30) is True
         assert cred.is_expiring_soon(days=7) is False
 
+    def test_explicit_reference_time(self) -> None:
+        expires_at = datetime(2025, 6, 15, 12, 0)
+        cred = make_facebook_credential(expires_at=expires_at)
+        now = expires_at - timedelta(days=5, hours=1)
+
+        assert cred.is_expired(now) is False
+        assert cred.days_until_expiry(now) == 5
+        assert cred.is_expiring_soon(days=5, now=now) is True
+        assert cred.is_expired(expires_at) is True
+
+
+@pytest.mark.unit
+class TestOAuthCredentialToDict:
+    """Tests for OAuthCredential.to_dict() metadata serialization."""
+
+    def test_serializes_dates_as_iso_strings(self) -> None:
+        expires = datetime(2026, 3, 1, 12, 30)
+        cred = make_facebook_credential(expires_at=expires)
+
+        data = cred.to_dict()
+
+        assert data["created_at"] == cred.created_at.isoformat()
+        assert data["expires_at"] == expires.isoformat()
+        assert data["provider"] == "facebook"
+
+    def test_omits_unset_optional_fields(self) -> None:
+        data = make_google_credential(expires_at=None, metadata=None).to_dict()
+
+        assert set(data) == {"provider", "identifier", "account_info", "created_at"}
+
+    def test_excludes_credentials(self) -> None:
+        assert "credentials" not in make_google_credential().to_dict()
+
+
+@pytest.mark.unit
+class TestOAuthCredentialFromDict:
+    """Tests for OAuthCredential.from_dict() metadata parsing."""
+
+    def test_round_trip(self) -> None:
+        cred = make_facebook_credential(
+            expires_at=datetime(2026, 3, 1, 12, 30, 15, 123456),
+            last_refreshed=datetime(2026, 2, 1),
+        )
+
+        loaded = OAuthCredential.from_dict("facebook_ads", cred.to_dict(), cred.credentials)
+
+        assert loaded == cred
+
+    def test_missing_metadata_uses_defaults(self) -> None:
+        loaded = OAuthCredential.from_dict("shopify", {}, {"private_app_password": "x"})
+
+        assert loaded.provider == "unknown"
+        assert loaded.created_at is not None
+        assert loaded.expires_at is None
+
+    def test_native_toml_datetime_passes_through(self) -> None:
+        expires = datetime(2026, 3, 1)
+        loaded = OAuthCredential.from_dict("facebook_ads", {"expires_at": expires}, {})
+        assert loaded.expires_at == expires
+
 
 # ---------------------------------------------------------------------------
 # Shopify storage (P6-002 regression)
@@ -193,6 +254,134 @@ class TestExistsBug:
         storage = OAuthStorage(tmp_path)
         assert storage.exists("nonexistent") is False
 
+    def test_exists_google_requires_client_id(self, tmp_path: Path) -> None:
+        """Google credentials objects count only when they carry a client_id."""
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_google_credential())
+        assert storage.exists("google_sheets") is True
+
+        storage.secrets_file.write_text('[sources.google_ads.credentials]\nrefresh_token = "x"\n')
+        assert storage.exists("google_ads") is False
+
+
+@pytest.mark.unit
+class TestUpdateLastRefreshed:
+    """Tests for OAuthStorage.update_last_refreshed()."""
+
+    def test_stamps_timestamp_and_keeps_credentials(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_google_credential())
+
+        assert storage.update_last_refreshed("google_sheets") is True
+
+        loaded = storage.get("google_sheets")
+        assert loaded is not None
+        assert loaded.last_refreshed is not None
+        assert loaded.credentials["refresh_token"] == "1//0abc-refresh-token"
+
+    def test_missing_metadata_returns_false(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        assert storage.update_last_refreshed("google_sheets") is False
+
+
+# ---------------------------------------------------------------------------
+# secrets.toml parse cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestSecretsCache:
+    """secrets.toml is parsed once and re-read only when the file changes."""
+
+    def test_repeated_reads_parse_once(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_facebook_credential())
+
+        with patch("dango.oauth.storage.tomllib.loads") as load:
+            assert storage.get("facebook_ads") is not None
+            assert storage.exists("facebook_ads") is True
+            assert len(storage.list()) == 1
+
+        load.assert_not_called()
+
+    def test_external_write_is_picked_up(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_facebook_credential())
+        assert storage.exists("facebook_ads") is True
+
+        storage.secrets_file.write_text('[sources.other]\nkey = "value"\n')
+
+        assert storage.exists("facebook_ads") is False
+
+    def test_saved_file_omits_none_values(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_google_credential(expires_at=None, metadata=None))
+
+        meta = tomllib.loads(storage.secrets_file.read_text())["dango"]["oauth"]["google_sheets"]
+        assert "expires_at" not in meta
+        assert "metadata" not in meta
+        assert meta["identifier"] == "user@gmail.com"
+
+    def test_mutating_loaded_credential_does_not_leak(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_facebook_credential())
+
+        loaded = storage.get("facebook_ads")
+        assert loaded is not None
+        loaded.credentials["access_token"] = "mutated"
+
+        reloaded = storage.get("facebook_ads")
+        assert reloaded is not None
+        assert reloaded.credentials["access_token"] != "mutated"
+
+    def test_mutating_listed_credential_does_not_leak(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_google_credential(metadata={"scopes": ["openid"]}))
+
+        listed = storage.list()[0]
+        listed.credentials["refresh_token"] = "mutated"
+        assert listed.metadata is not None
+        listed.metadata["scopes"].append("mutated")
+
+        reloaded = storage.get("google_sheets")
+        assert reloaded is not None
+        assert reloaded.credentials["refresh_token"] == "1//0abc-refresh-token"
+        assert reloaded.metadata == {"scopes": ["openid"]}
+
+    def test_unchanged_save_skips_write(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        cred = make_facebook_credential()
+        storage.save(cred)
+
+        with patch("dango.oauth.storage.os.replace") as replace:
+            assert storage.save(cred) is True
+
+        replace.assert_not_called()
+
+    def test_save_copies_only_the_written_sections(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_facebook_credential())
+
+        with patch("dango.oauth.storage.copy.deepcopy") as deepcopy:
+            assert storage.save(make_google_credential()) is True
+
+        deepcopy.assert_not_called()
+        facebook = storage.get("facebook_ads")
+        assert facebook is not None
+        assert facebook.credentials["access_token"] == "EAABsbCS1IXXZD-long-lived-token"
+        assert storage.get("google_sheets") is not None
+
+    def test_failed_write_keeps_original_file(self, tmp_path: Path) -> None:
+        storage = OAuthStorage(tmp_path)
+        storage.save(make_facebook_credential())
+        original = storage.secrets_file.read_text()
+
+        with patch("dango.oauth.storage.tomli_w.dump", side_effect=OSError("disk full")):
+            assert storage.save(make_google_credential()) is False
+
+        assert storage.secrets_file.read_text() == original
+        assert list(storage.dlt_dir.glob("*.tmp")) == []
+
 
 # ---------------------------------------------------------------------------
 # Graceful degradation
@@ -215,6 +404,18 @@ class TestStorageGracefulDegradation:
         storage.secrets_file.write_text("{{{{not valid toml")
         assert storage.list() == []
 
+    def test_list_skips_entry_with_malformed_timestamp(self, tmp_path: Path) -> None:
+        """A bad created_at skips that credential but still lists the others."""
+        storage = OAuthStorage(tmp_path)
+        storage.secrets_file.write_text(
+            '[sources.facebook_ads]\naccess_token = "EAA-token"\n'
+            '[sources.shopify]\nprivate_app_password = "shpat_x"\n'
+            '[dango.oauth.facebook_ads]\nprovider = "facebook"\ncreated_at = "yesterday"\n'
+            '[dango.oauth.shopify]\nprovider = "shopify"\ncreated_at = "2026-01-02T03:04:05"\n'
+        )
+
+        assert [c.source_type for c in storage.list()] == ["shopify"]
+
     def test_get_empty_source_returns_none(self, tmp_path: Path) -> None:
         """Empty source section → get() returns None."""
         storage = OAuthStorage(tmp_path)
@@ -20,6 +20,7 @@ from dango.oauth.validation import (
     validate_google_token,
     validate_shopify_token,
     validate_token,
+    validate_tokens,
 )
 from tests.factories.oauth_factories import (
     make_facebook_credential,
@@ -291,6 +292,18 @@ class TestValidateShopifyToken:
         assert result.valid is True
         assert "My Awesome Store" in result.account_info
 
+    @patch("dango.oauth.validation.requests")
+    def test_requests_only_shop_name(self, mock_requests: MagicMock) -> None:
+        """shop.json is requested with fields=name to skip the full payload."""
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = {"shop": {"name": "My Awesome Store"}}
+        mock_requests.get.return_value = resp
+
+        validate_shopify_token(make_shopify_credential())
+
+        assert mock_requests.get.call_args.kwargs["params"] == {"fields": "name"}
+
     @patch("dango.oauth.validation.requests")
     def test_invalid_token(self, mock_requests: MagicMock) -> None:
         """401 from shop.json returns revoked result."""
@@ -578,3 +591,32 @@ class TestValidateAllTokens:
 
         results = validate_all_tokens(tmp_path)
         assert results == []
+
+
+@pytest.mark.unit
+class TestValidateTokens:
+    """Tests for validate_tokens() concurrent validation."""
+
+    @patch("dango.oauth.validation.validate_token")
+    def test_results_keep_credential_order(self, mock_validate: MagicMock) -> None:
+        """Results line up with the input credentials when run on the pool."""
+        creds = [make_oauth_credential(source_type=f"source_{i}") for i in range(5)]
+        mock_validate.side_effect = lambda cred: TokenValidationResult(
+            source_type=cred.source_type, provider=cred.provider, valid=True, message="ok"
+        )
+
+        results = validate_tokens(creds)
+
+        assert [r.source_type for r in results] == [c.source_type for c in creds]
+        assert mock_validate.call_count == 5
+
+    @patch("dango.oauth.validation.ThreadPoolExecutor")
+    @patch("dango.oauth.validation.validate_token")
+    def test_small_batches_run_inline(
+        self, mock_validate: MagicMock, mock_executor: MagicMock
+    ) -> None:
+        """One or two credentials skip the thread pool."""
+        validate_tokens([make_google_credential(), make_facebook_credential()])
+
+        assert mock_validate.call_count == 2
+        mock_executor.assert_not_called()
@@ -0,0 +1,38 @@
+"""tests/unit/test_security_token_storage.py
+
+Tests for dango/security/token_storage.py — SecureTokenStorage encryption.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from dango.security.token_storage import SecureTokenStorage
+
+
+@pytest.mark.unit
+class TestSecureTokenStorageCipher:
+    """The master key is fetched once and the Fernet cipher reused."""
+
+    @patch("dango.security.token_storage.keyring")
+    def test_round_trip_fetches_key_once(self, mock_keyring: MagicMock, tmp_path: Path) -> None:
+        mock_keyring.get_password.return_value = Fernet.generate_key().decode("utf-8")
+        storage = SecureTokenStorage(tmp_path)
+
+        tokens = [storage.encrypt_token({"access_token": f"token-{i}"}) for i in range(3)]
+        decrypted = [storage.decrypt_token(token) for token in tokens]
+
+        assert [d["access_token"] for d in decrypted] == ["token-0", "token-1", "token-2"]
+        assert mock_keyring.get_password.call_count == 1
+
+    @patch("dango.security.token_storage.keyring")
+    def test_instances_share_keychain_key(self, mock_keyring: MagicMock, tmp_path: Path) -> None:
+        mock_keyring.get_password.return_value = Fernet.generate_key().decode("utf-8")
+
+        encrypted = SecureTokenStorage(tmp_path).encrypt_token({"password": "secret"})
+
+        assert SecureTokenStorage(tmp_path).decrypt_token(encrypted) == {"password": "secret"}